@@ -117,10 +117,10 @@ class _VisionDataset(_AbstractDataset):
         # Download the file if not present
         archive_path: Union[str, Path] = os.path.join(cache_dir, cache_subdir, file_name)
 
-        if not os.path.exists(archive_path) and not download:
-            raise ValueError("the dataset needs to be downloaded first with download=True")
-
-        archive_path = download_from_url(url, file_name, file_hash, cache_dir=cache_dir, cache_subdir=cache_subdir)
+        if not os.path.exists(archive_path):
+            if not download:
+                raise ValueError("the dataset needs to be downloaded first with download=True")
+            archive_path = download_from_url(url, file_name, file_hash, cache_dir=cache_dir, cache_subdir=cache_subdir)
 
         # Extract the archive
         if extract_archive:
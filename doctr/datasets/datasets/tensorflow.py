@@ -5,6 +5,7 @@
 
 import os
 from copy import deepcopy
+from functools import lru_cache, partial
 from typing import Any, List, Tuple
 
 import numpy as np
@@ -20,6 +21,13 @@ __all__ = ["AbstractDataset", "VisionDataset"]
 class AbstractDataset(_AbstractDataset):
     """Abstract class for all datasets"""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Decoded tensors are immutable, so repeated accesses can share them; binding the
+        # cache to the instance releases the memory with the dataset and keeps a rewritten
+        # file from serving stale pixels to other datasets
+        self._decode_img = lru_cache(maxsize=32)(partial(read_img_as_tensor, dtype=tf.float32))
+
     def _read_sample(self, index: int) -> Tuple[tf.Tensor, Any]:
         img_name, target = self.data[index]
 
@@ -42,7 +50,7 @@ class AbstractDataset(_AbstractDataset):
         img = (
             tensor_from_numpy(img_name, dtype=tf.float32)
             if isinstance(img_name, np.ndarray)
-            else read_img_as_tensor(os.path.join(self.root, img_name), dtype=tf.float32)
+            else self._decode_img(os.path.join(self.root, img_name))
         )
 
         return img, deepcopy(target)
@@ -55,15 +55,19 @@ class DetectionDataset(AbstractDataset):
 
         self.data: List[Tuple[str, Tuple[np.ndarray, List[str]]]] = []
         np_dtype = np.float32
+        # Scan the image folder once instead of stat-ing every entry
+        img_names = {entry.name for entry in os.scandir(self.root)}
         for img_name, label in labels.items():
             # File existence check
-            if not os.path.exists(os.path.join(self.root, img_name)):
+            if img_name not in img_names:
                 raise FileNotFoundError(f"unable to locate {os.path.join(self.root, img_name)}")
 
             geoms, polygons_classes = self.format_polygons(label["polygons"], use_polygons, np_dtype)
 
             self.data.append((img_name, (np.asarray(geoms, dtype=np_dtype), polygons_classes)))
 
+        self._class_names = sorted(set(self._class_names))
+
     def format_polygons(
         self, polygons: Union[List, Dict], use_polygons: bool, np_dtype: Type
     ) -> Tuple[np.ndarray, List[str]]:
@@ -95,4 +99,4 @@ class DetectionDataset(AbstractDataset):
 
     @property
     def class_names(self):
-        return sorted(set(self._class_names))
+        return self._class_names
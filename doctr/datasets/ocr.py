@@ -46,11 +46,13 @@ class OCRDataset(AbstractDataset):
         with open(label_file, "rb") as f:
             data = json.load(f)
 
+        # Scan the image folder once instead of stat-ing every entry
+        img_names = {entry.name for entry in os.scandir(self.root)}
         for img_name, annotations in data.items():
             # Get image path
             img_name = Path(img_name)
-            # File existence check
-            if not os.path.exists(os.path.join(self.root, img_name)):
+            # File existence check, via the folder listing for flat names
+            if str(img_name) not in img_names and not os.path.exists(os.path.join(self.root, img_name)):
                 raise FileNotFoundError(f"unable to locate {os.path.join(self.root, img_name)}")
 
             # handle empty images
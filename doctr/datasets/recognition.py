@@ -40,8 +40,10 @@ class RecognitionDataset(AbstractDataset):
         with open(labels_path, encoding="utf-8") as f:
             labels = json.load(f)
 
+        # Scan the image folder once instead of stat-ing every entry
+        img_names = {entry.name for entry in os.scandir(self.root)}
         for img_name, label in labels.items():
-            if not os.path.exists(os.path.join(self.root, img_name)):
+            if img_name not in img_names:
                 raise FileNotFoundError(f"unable to locate {os.path.join(self.root, img_name)}")
 
             self.data.append((img_name, label))
@@ -48,7 +48,10 @@ def read_img_as_tensor(img_path: AbstractPath, dtype: tf.dtypes.DType = tf.float
         raise ValueError("insupported value for dtype")
 
     img = tf.io.read_file(img_path)
-    img = tf.image.decode_jpeg(img, channels=3)
+    # Integer-fast IDCT without fancy chroma upscaling is noticeably faster on CPU
+    img = tf.image.decode_jpeg(
+        img, channels=3, dct_method="INTEGER_FAST", fancy_upscaling=False, try_recover_truncated=True
+    )
 
     if dtype != tf.uint8:
         img = tf.image.convert_image_dtype(img, dtype=dtype)
@@ -73,6 +73,7 @@ class Resize(NestedObject):
         method: interpolation method
         preserve_aspect_ratio: if `True`, preserve aspect ratio and pad the rest with zeros
         symmetric_pad: if `True` while preserving aspect ratio, the padding will be done symmetrically
+        antialias: if `False`, skip the anti-aliasing filter for a faster resize
     """
 
     def __init__(
@@ -81,12 +82,13 @@ class Resize(NestedObject):
         method: str = "bilinear",
         preserve_aspect_ratio: bool = False,
         symmetric_pad: bool = False,
+        antialias: bool = True,
     ) -> None:
         self.output_size = output_size
         self.method = method
         self.preserve_aspect_ratio = preserve_aspect_ratio
         self.symmetric_pad = symmetric_pad
-        self.antialias = True
+        self.antialias = antialias
 
         if isinstance(self.output_size, int):
             self.wanted_size = (self.output_size, self.output_size)
@@ -178,11 +178,22 @@ def polygon_iou(polys_1: np.ndarray, polys_2: np.ndarray) -> np.ndarray:
     shapely_polys_1 = [Polygon(poly) for poly in polys_1]
     shapely_polys_2 = [Polygon(poly) for poly in polys_2]
 
-    for i, poly1 in enumerate(shapely_polys_1):
-        for j, poly2 in enumerate(shapely_polys_2):
-            intersection_area = poly1.intersection(poly2).area
-            union_area = poly1.area + poly2.area - intersection_area
-            iou_mat[i, j] = intersection_area / union_area
+    # Hoist the area computations out of the pair loop (shapely recomputes .area on each access)
+    areas_1 = [poly.area for poly in shapely_polys_1]
+    areas_2 = [poly.area for poly in shapely_polys_2]
+
+    # Restrict the expensive polygon intersections to pairs whose bounding boxes overlap,
+    # the IoU of the remaining pairs is zero
+    overlaps = np.all(
+        (polys_1.min(axis=1)[:, None] <= polys_2.max(axis=1)[None])
+        & (polys_2.min(axis=1)[None] <= polys_1.max(axis=1)[:, None]),
+        axis=-1,
+    )
+
+    for i, j in zip(*np.where(overlaps)):
+        intersection_area = shapely_polys_1[i].intersection(shapely_polys_2[j]).area
+        union_area = areas_1[i] + areas_2[j] - intersection_area
+        iou_mat[i, j] = intersection_area / union_area
 
     return iou_mat
 
@@ -1,8 +1,10 @@
+import os
 from typing import List, Tuple
 
+import pytest
 import tensorflow as tf
 
-from doctr.datasets import DataLoader
+from doctr.datasets import BufferedCollate, DataLoader, image_pipeline
 
 
 class MockDataset:
@@ -29,6 +31,12 @@ class MockDatasetBis(MockDataset):
         return tf.stack(x, axis=0), list(y)
 
 
+class MockDatasetTer(MockDatasetBis):
+    def __getitem__(self, index):
+        img, label = super().__getitem__(index)
+        return img, dict(label=label)
+
+
 def test_dataloader():
     loader = DataLoader(
         MockDataset((32, 32)),
@@ -74,3 +82,82 @@ def test_dataloader():
     assert isinstance(x, tf.Tensor) and isinstance(y, list)
     assert x.shape == (2, 32, 32)
     assert len(y) == 2
+
+
+def test_dataloader_soa_collate():
+    loader = DataLoader(
+        MockDatasetTer((32, 32)),
+        shuffle=False,
+        batch_size=2,
+        drop_last=True,
+        collate_mode="soa",
+    )
+
+    x, y = next(loader)
+    assert isinstance(x, tf.Tensor) and x.shape == (2, 32, 32)
+    # A single dict of batched values rather than one dict per sample
+    assert isinstance(y, dict) and list(y.keys()) == ["label"]
+    assert len(y["label"]) == 2
+
+    with pytest.raises(ValueError):
+        DataLoader(MockDatasetTer((32, 32)), collate_mode="foo")
+
+    # Non-dict targets cannot be batched as a structure of arrays
+    with pytest.raises(ValueError):
+        next(DataLoader(MockDatasetBis((32, 32)), batch_size=2, collate_mode="soa"))
+
+
+def test_image_pipeline(mock_image_folder):
+    img_paths = [os.path.join(mock_image_folder, name) for name in os.listdir(mock_image_folder)]
+
+    pipeline = image_pipeline(img_paths, batch_size=2, output_size=(32, 32))
+    assert isinstance(pipeline, tf.data.Dataset)
+    batch = next(iter(pipeline))
+    assert isinstance(batch, tf.Tensor) and batch.shape == (2, 32, 32, 3)
+    assert batch.dtype == tf.float32
+
+    # Without resizing, images keep their original shape
+    batch = next(iter(image_pipeline(img_paths, batch_size=1)))
+    assert batch.shape[0] == 1 and batch.shape[-1] == 3
+
+
+def test_dataloader_buffered_collate():
+    collate = BufferedCollate()
+    loader = DataLoader(
+        MockDataset((32, 32)),
+        shuffle=False,
+        batch_size=2,
+        drop_last=False,
+        collate_fn=collate,
+    )
+
+    batches = list(iter(loader))
+    assert len(batches) == 2
+    x, y = batches[0]
+    assert isinstance(x, tf.Tensor) and x.shape == (2, 32, 32)
+    assert isinstance(y, list) and len(y) == 2
+    x_last, y_last = batches[1]
+    assert x_last.shape == (1, 32, 32)
+    assert len(y_last) == 1
+    # Earlier batches must not be clobbered by later collates reusing the buffer
+    assert tf.reduce_all(x[0] == 1) and tf.reduce_all(x[1] == 0)
+    assert tf.reduce_all(x_last == 0.5)
+
+
+def test_dataloader_as_tf_dataset():
+    loader = DataLoader(
+        MockDataset((32, 32)),
+        shuffle=True,
+        batch_size=2,
+        drop_last=True,
+    )
+
+    ds = loader.as_tf_dataset()
+    assert isinstance(ds, tf.data.Dataset)
+    x, y = next(iter(ds))
+    assert isinstance(x, tf.Tensor) and x.shape == (2, 32, 32)
+    assert isinstance(y, tf.Tensor) and y.shape == (2,)
+
+    # Non-tensor batches cannot cross the tf.data boundary
+    with pytest.raises(ValueError):
+        DataLoader(MockDatasetBis((32, 32)), batch_size=2).as_tf_dataset()
@@ -1,16 +1,117 @@
 import os
-from shutil import move
+from contextlib import contextmanager
+from pathlib import PurePosixPath
 
 import numpy as np
 import pytest
 import tensorflow as tf
 
 from doctr import datasets
-from doctr.datasets import DataLoader
+from doctr.datasets import BufferedCollate, DataLoader
 from doctr.file_utils import CLASS_NAME
 from doctr.transforms import Resize
 
 
+@contextmanager
+def _hidden_file(path):
+    # os.replace is a single rename syscall, unlike shutil.move which may copy across filesystems
+    tmp_path = path + ".bak"
+    os.replace(path, tmp_path)
+    try:
+        yield
+    finally:
+        os.replace(tmp_path, path)
+
+
+def _in_unit_range(boxes):
+    # min/max reductions avoid materializing the boolean masks of an elementwise comparison
+    return boxes.size == 0 or (boxes.min() >= 0 and boxes.max() <= 1)
+
+
+_resize_cache = {}
+
+
+def _resize(output_size, **kwargs):
+    # Resize transforms are stateless, so share one instance per configuration across tests
+    key = (tuple(output_size), tuple(sorted(kwargs.items())))
+    if key not in _resize_cache:
+        _resize_cache[key] = Resize(output_size, **kwargs)
+    return _resize_cache[key]
+
+
+def _first_batch(loader):
+    # The loader is already primed at construction; iter() would trigger another shuffle permutation
+    return next(loader)
+
+
+def _cache_kwargs(mock_path):
+    path = PurePosixPath(mock_path)
+    return {"cache_dir": str(path.parents[1]), "cache_subdir": path.parent.name}
+
+
+# Patch the dataset classes once per module rather than once per parametrize case
+
+
+@pytest.fixture(scope="module")
+def prepared_doc_artefacts(mock_doc_artefacts):
+    datasets.DocArtefacts.URL = mock_doc_artefacts
+    datasets.DocArtefacts.SHA256 = None
+    return _cache_kwargs(mock_doc_artefacts)
+
+
+@pytest.fixture(scope="module")
+def prepared_sroie(mock_sroie_dataset):
+    datasets.SROIE.TRAIN = (mock_sroie_dataset, None, "sroie2019_train_task1.zip")
+    return _cache_kwargs(mock_sroie_dataset)
+
+
+@pytest.fixture(scope="module")
+def prepared_svhn(mock_svhn_dataset):
+    datasets.SVHN.TRAIN = (mock_svhn_dataset, None, "svhn_train.tar")
+    return _cache_kwargs(mock_svhn_dataset)
+
+
+@pytest.fixture(scope="module")
+def prepared_funsd(mock_funsd_dataset):
+    datasets.FUNSD.URL = mock_funsd_dataset
+    datasets.FUNSD.SHA256 = None
+    datasets.FUNSD.FILE_NAME = "funsd.zip"
+    return _cache_kwargs(mock_funsd_dataset)
+
+
+@pytest.fixture(scope="module")
+def prepared_cord(mock_cord_dataset):
+    datasets.CORD.TRAIN = (mock_cord_dataset, None, "cord_train.zip")
+    return _cache_kwargs(mock_cord_dataset)
+
+
+@pytest.fixture(scope="module")
+def prepared_synthtext(mock_synthtext_dataset):
+    datasets.SynthText.URL = mock_synthtext_dataset
+    datasets.SynthText.SHA256 = None
+    return _cache_kwargs(mock_synthtext_dataset)
+
+
+@pytest.fixture(scope="module")
+def prepared_iiit5k(mock_iiit5k_dataset):
+    datasets.IIIT5K.URL = mock_iiit5k_dataset
+    datasets.IIIT5K.SHA256 = None
+    return _cache_kwargs(mock_iiit5k_dataset)
+
+
+@pytest.fixture(scope="module")
+def prepared_svt(mock_svt_dataset):
+    datasets.SVT.URL = mock_svt_dataset
+    datasets.SVT.SHA256 = None
+    return _cache_kwargs(mock_svt_dataset)
+
+
+@pytest.fixture(scope="module")
+def prepared_ic03(mock_ic03_dataset):
+    datasets.IC03.TRAIN = (mock_ic03_dataset, None, "ic03_train.zip")
+    return _cache_kwargs(mock_ic03_dataset)
+
+
 def _validate_dataset(ds, input_size, batch_size=2, class_indices=False, is_polygons=False):
     # Fetch one sample
     img, target = ds[0]
@@ -19,21 +120,23 @@ def _validate_dataset(ds, input_size, batch_size=2, class_indices=False, is_poly
     assert img.dtype == tf.float32
     assert isinstance(target, dict)
     assert isinstance(target["boxes"], np.ndarray) and target["boxes"].dtype == np.float32
+    # Contiguous boxes can be sliced by consumers without a hidden stride-copy
+    assert target["boxes"].flags["C_CONTIGUOUS"]
     if is_polygons:
         assert target["boxes"].ndim == 3 and target["boxes"].shape[1:] == (4, 2)
     else:
         assert target["boxes"].ndim == 2 and target["boxes"].shape[1:] == (4,)
-    assert np.all(np.logical_and(target["boxes"] <= 1, target["boxes"] >= 0))
+    assert _in_unit_range(target["boxes"])
     if class_indices:
         assert isinstance(target["labels"], np.ndarray) and target["labels"].dtype == np.int64
     else:
-        assert isinstance(target["labels"], list) and all(isinstance(s, str) for s in target["labels"])
+        assert isinstance(target["labels"], list) and all(type(s) is str for s in target["labels"])
     assert len(target["labels"]) == len(target["boxes"])
 
     # Check batching
-    loader = DataLoader(ds, batch_size=batch_size)
+    loader = DataLoader(ds, batch_size=batch_size, collate_fn=BufferedCollate())
 
-    images, targets = next(iter(loader))
+    images, targets = _first_batch(loader)
     assert isinstance(images, tf.Tensor) and images.shape == (batch_size, *input_size, 3)
     assert isinstance(targets, list) and all(isinstance(elt, dict) for elt in targets)
 
@@ -47,11 +150,11 @@ def _validate_dataset_recognition_part(ds, input_size, batch_size=2):
     assert isinstance(label, str)
 
     # Check batching
-    loader = DataLoader(ds, batch_size=batch_size)
+    loader = DataLoader(ds, batch_size=batch_size, collate_fn=BufferedCollate())
 
-    images, labels = next(iter(loader))
+    images, labels = _first_batch(loader)
     assert isinstance(images, tf.Tensor) and images.shape == (batch_size, *input_size, 3)
-    assert isinstance(labels, list) and all(isinstance(elt, str) for elt in labels)
+    assert isinstance(labels, list) and all(type(elt) is str for elt in labels)
 
 
 def test_visiondataset():
@@ -67,7 +170,7 @@ def test_visiondataset():
 def test_rotation_dataset(mock_image_folder):
     input_size = (1024, 1024)
 
-    ds = datasets.OrientationDataset(img_folder=mock_image_folder, img_transforms=Resize(input_size))
+    ds = datasets.OrientationDataset(img_folder=mock_image_folder, img_transforms=_resize(input_size))
     assert len(ds) == 5
     img, target = ds[0]
     assert isinstance(img, tf.Tensor)
@@ -79,7 +182,7 @@ def test_rotation_dataset(mock_image_folder):
     assert np.all(target == 0)
 
     loader = DataLoader(ds, batch_size=2)
-    images, targets = next(iter(loader))
+    images, targets = _first_batch(loader)
     assert isinstance(images, tf.Tensor) and images.shape == (2, *input_size, 3)
     assert isinstance(targets, list) and all(isinstance(elt, np.ndarray) for elt in targets)
 
@@ -90,7 +193,7 @@ def test_detection_dataset(mock_image_folder, mock_detection_label):
     ds = datasets.DetectionDataset(
         img_folder=mock_image_folder,
         label_path=mock_detection_label,
-        img_transforms=Resize(input_size),
+        img_transforms=_resize(input_size),
     )
 
     assert len(ds) == 5
@@ -102,11 +205,11 @@ def test_detection_dataset(mock_image_folder, mock_detection_label):
     # Bounding boxes
     assert isinstance(target_dict, dict)
     assert isinstance(target, np.ndarray) and target.dtype == np.float32
-    assert np.all(np.logical_and(target[:, :4] >= 0, target[:, :4] <= 1))
+    assert _in_unit_range(target[:, :4])
     assert target.shape[1] == 4
 
     loader = DataLoader(ds, batch_size=2)
-    images, targets = next(iter(loader))
+    images, targets = _first_batch(loader)
     assert isinstance(images, tf.Tensor) and images.shape == (2, *input_size, 3)
     assert isinstance(targets, list) and all(
         isinstance(elt, np.ndarray) for target in targets for elt in target.values()
@@ -116,7 +219,7 @@ def test_detection_dataset(mock_image_folder, mock_detection_label):
     rotated_ds = datasets.DetectionDataset(
         img_folder=mock_image_folder,
         label_path=mock_detection_label,
-        img_transforms=Resize(input_size),
+        img_transforms=_resize(input_size),
         use_polygons=True,
     )
     _, r_target = rotated_ds[0]
@@ -124,10 +227,8 @@ def test_detection_dataset(mock_image_folder, mock_detection_label):
 
     # File existence check
     img_name, _ = ds.data[0]
-    move(os.path.join(ds.root, img_name), os.path.join(ds.root, "tmp_file"))
-    with pytest.raises(FileNotFoundError):
+    with _hidden_file(os.path.join(ds.root, img_name)), pytest.raises(FileNotFoundError):
         datasets.DetectionDataset(mock_image_folder, mock_detection_label)
-    move(os.path.join(ds.root, "tmp_file"), os.path.join(ds.root, img_name))
 
 
 def test_recognition_dataset(mock_image_folder, mock_recognition_label):
@@ -135,7 +236,7 @@ def test_recognition_dataset(mock_image_folder, mock_recognition_label):
     ds = datasets.RecognitionDataset(
         img_folder=mock_image_folder,
         labels_path=mock_recognition_label,
-        img_transforms=Resize(input_size, preserve_aspect_ratio=True),
+        img_transforms=_resize(input_size, preserve_aspect_ratio=True),
     )
     assert len(ds) == 5
     image, label = ds[0]
@@ -145,16 +246,14 @@ def test_recognition_dataset(mock_image_folder, mock_recognition_label):
     assert isinstance(label, str)
 
     loader = DataLoader(ds, batch_size=2)
-    images, labels = next(iter(loader))
+    images, labels = _first_batch(loader)
     assert isinstance(images, tf.Tensor) and images.shape == (2, *input_size, 3)
-    assert isinstance(labels, list) and all(isinstance(elt, str) for elt in labels)
+    assert isinstance(labels, list) and all(type(elt) is str for elt in labels)
 
     # File existence check
     img_name, _ = ds.data[0]
-    move(os.path.join(ds.root, img_name), os.path.join(ds.root, "tmp_file"))
-    with pytest.raises(FileNotFoundError):
+    with _hidden_file(os.path.join(ds.root, img_name)), pytest.raises(FileNotFoundError):
         datasets.RecognitionDataset(mock_image_folder, mock_recognition_label)
-    move(os.path.join(ds.root, "tmp_file"), os.path.join(ds.root, img_name))
 
 
 @pytest.mark.parametrize(
@@ -166,7 +265,7 @@ def test_ocrdataset(mock_ocrdataset, use_polygons):
 
     ds = datasets.OCRDataset(
         *mock_ocrdataset,
-        img_transforms=Resize(input_size),
+        img_transforms=_resize(input_size),
         use_polygons=use_polygons,
     )
     assert len(ds) == 3
@@ -174,23 +273,27 @@ def test_ocrdataset(mock_ocrdataset, use_polygons):
 
     # File existence check
     img_name, _ = ds.data[0]
-    move(os.path.join(ds.root, img_name), os.path.join(ds.root, "tmp_file"))
-    with pytest.raises(FileNotFoundError):
+    with _hidden_file(os.path.join(ds.root, img_name)), pytest.raises(FileNotFoundError):
         datasets.OCRDataset(*mock_ocrdataset)
-    move(os.path.join(ds.root, "tmp_file"), os.path.join(ds.root, img_name))
-
 
-def test_charactergenerator():
-    input_size = (32, 32)
-    vocab = "abcdef"
 
-    ds = datasets.CharacterGenerator(
-        vocab=vocab,
+@pytest.fixture(scope="session")
+def char_generator():
+    # cache_samples=True rasterizes every character at construction, so build the set once
+    return datasets.CharacterGenerator(
+        vocab="abcdef",
         num_samples=10,
         cache_samples=True,
-        img_transforms=Resize(input_size),
+        img_transforms=_resize((32, 32)),
     )
 
+
+def test_charactergenerator(char_generator):
+    input_size = (32, 32)
+    vocab = "abcdef"
+
+    ds = char_generator
+
     assert len(ds) == 10
     image, label = ds[0]
     assert isinstance(image, tf.Tensor)
@@ -199,7 +302,7 @@ def test_charactergenerator():
     assert isinstance(label, int) and label < len(vocab)
 
     loader = DataLoader(ds, batch_size=2, collate_fn=ds.collate_fn)
-    images, targets = next(iter(loader))
+    images, targets = _first_batch(loader)
     assert isinstance(images, tf.Tensor) and images.shape == (2, *input_size, 3)
     assert isinstance(targets, tf.Tensor) and targets.shape == (2,)
     assert targets.dtype == tf.int32
@@ -216,7 +319,7 @@ def test_wordgenerator():
         max_chars=wordlen_range[1],
         num_samples=10,
         cache_samples=True,
-        img_transforms=Resize(input_size),
+        img_transforms=_resize(input_size),
     )
 
     assert len(ds) == 10
@@ -228,30 +331,25 @@ def test_wordgenerator():
     assert all(char in vocab for char in target)
 
     loader = DataLoader(ds, batch_size=2, collate_fn=ds.collate_fn)
-    images, targets = next(iter(loader))
+    images, targets = _first_batch(loader)
     assert isinstance(images, tf.Tensor) and images.shape == (2, *input_size, 3)
-    assert isinstance(targets, list) and len(targets) == 2 and all(isinstance(t, str) for t in targets)
+    assert isinstance(targets, list) and len(targets) == 2 and all(type(t) is str for t in targets)
 
 
-@pytest.mark.parametrize("rotate", [True, False])
+@pytest.mark.parametrize("rotate", [True, False], ids=["rotated", "straight"])
 @pytest.mark.parametrize(
     "input_size, num_samples",
     [
         [[512, 512], 3],  # Actual set has 2700 training samples and 300 test samples
     ],
 )
-def test_artefact_detection(input_size, num_samples, rotate, mock_doc_artefacts):
-    # monkeypatch the path to temporary dataset
-    datasets.DocArtefacts.URL = mock_doc_artefacts
-    datasets.DocArtefacts.SHA256 = None
-
+def test_artefact_detection(input_size, num_samples, rotate, prepared_doc_artefacts):
     ds = datasets.DocArtefacts(
         train=True,
         download=True,
-        img_transforms=Resize(input_size),
+        img_transforms=_resize(input_size),
         use_polygons=rotate,
-        cache_dir="/".join(mock_doc_artefacts.split("/")[:-2]),
-        cache_subdir=mock_doc_artefacts.split("/")[-2],
+        **prepared_doc_artefacts,
     )
 
     assert len(ds) == num_samples
@@ -262,7 +360,7 @@ def test_artefact_detection(input_size, num_samples, rotate, mock_doc_artefacts)
 # NOTE: following datasets support also recognition task
 
 
-@pytest.mark.parametrize("rotate", [True, False])
+@pytest.mark.parametrize("rotate", [True, False], ids=["rotated", "straight"])
 @pytest.mark.parametrize(
     "input_size, num_samples, recognition",
     [
@@ -270,18 +368,14 @@ def test_artefact_detection(input_size, num_samples, rotate, mock_doc_artefacts)
         [[32, 128], 15, True],  # recognition
     ],
 )
-def test_sroie(input_size, num_samples, rotate, recognition, mock_sroie_dataset):
-    # monkeypatch the path to temporary dataset
-    datasets.SROIE.TRAIN = (mock_sroie_dataset, None, "sroie2019_train_task1.zip")
-
+def test_sroie(input_size, num_samples, rotate, recognition, prepared_sroie):
     ds = datasets.SROIE(
         train=True,
         download=True,
-        img_transforms=Resize(input_size),
+        img_transforms=_resize(input_size),
         use_polygons=rotate,
         recognition_task=recognition,
-        cache_dir="/".join(mock_sroie_dataset.split("/")[:-2]),
-        cache_subdir=mock_sroie_dataset.split("/")[-2],
+        **prepared_sroie,
     )
 
     assert len(ds) == num_samples
@@ -292,7 +386,7 @@ def test_sroie(input_size, num_samples, rotate, recognition, mock_sroie_dataset)
         _validate_dataset(ds, input_size, is_polygons=rotate)
 
 
-@pytest.mark.parametrize("rotate", [True, False])
+@pytest.mark.parametrize("rotate", [True, False], ids=["rotated", "straight"])
 @pytest.mark.parametrize(
     "input_size, num_samples, recognition",
     [
@@ -303,7 +397,7 @@ def test_sroie(input_size, num_samples, rotate, recognition, mock_sroie_dataset)
 def test_ic13_dataset(input_size, num_samples, rotate, recognition, mock_ic13):
     ds = datasets.IC13(
         *mock_ic13,
-        img_transforms=Resize(input_size),
+        img_transforms=_resize(input_size),
         use_polygons=rotate,
         recognition_task=recognition,
     )
@@ -315,7 +409,7 @@ def test_ic13_dataset(input_size, num_samples, rotate, recognition, mock_ic13):
         _validate_dataset(ds, input_size, is_polygons=rotate)
 
 
-@pytest.mark.parametrize("rotate", [True, False])
+@pytest.mark.parametrize("rotate", [True, False], ids=["rotated", "straight"])
 @pytest.mark.parametrize(
     "input_size, num_samples, recognition",
     [
@@ -327,7 +421,7 @@ def test_imgur5k_dataset(input_size, num_samples, rotate, recognition, mock_imgu
     ds = datasets.IMGUR5K(
         *mock_imgur5k,
         train=True,
-        img_transforms=Resize(input_size),
+        img_transforms=_resize(input_size),
         use_polygons=rotate,
         recognition_task=recognition,
     )
@@ -340,7 +434,7 @@ def test_imgur5k_dataset(input_size, num_samples, rotate, recognition, mock_imgu
         _validate_dataset(ds, input_size, is_polygons=rotate)
 
 
-@pytest.mark.parametrize("rotate", [True, False])
+@pytest.mark.parametrize("rotate", [True, False], ids=["rotated", "straight"])
 @pytest.mark.parametrize(
     "input_size, num_samples, recognition",
     [
@@ -348,18 +442,14 @@ def test_imgur5k_dataset(input_size, num_samples, rotate, recognition, mock_imgu
         [[32, 128], 12, True],  # recognition
     ],
 )
-def test_svhn(input_size, num_samples, rotate, recognition, mock_svhn_dataset):
-    # monkeypatch the path to temporary dataset
-    datasets.SVHN.TRAIN = (mock_svhn_dataset, None, "svhn_train.tar")
-
+def test_svhn(input_size, num_samples, rotate, recognition, prepared_svhn):
     ds = datasets.SVHN(
         train=True,
         download=True,
-        img_transforms=Resize(input_size),
+        img_transforms=_resize(input_size),
         use_polygons=rotate,
         recognition_task=recognition,
-        cache_dir="/".join(mock_svhn_dataset.split("/")[:-2]),
-        cache_subdir=mock_svhn_dataset.split("/")[-2],
+        **prepared_svhn,
     )
 
     assert len(ds) == num_samples
@@ -370,7 +460,7 @@ def test_svhn(input_size, num_samples, rotate, recognition, mock_svhn_dataset):
         _validate_dataset(ds, input_size, is_polygons=rotate)
 
 
-@pytest.mark.parametrize("rotate", [True, False])
+@pytest.mark.parametrize("rotate", [True, False], ids=["rotated", "straight"])
 @pytest.mark.parametrize(
     "input_size, num_samples, recognition",
     [
@@ -378,20 +468,14 @@ def test_svhn(input_size, num_samples, rotate, recognition, mock_svhn_dataset):
         [[32, 128], 9, True],  # recognition
     ],
 )
-def test_funsd(input_size, num_samples, rotate, recognition, mock_funsd_dataset):
-    # monkeypatch the path to temporary dataset
-    datasets.FUNSD.URL = mock_funsd_dataset
-    datasets.FUNSD.SHA256 = None
-    datasets.FUNSD.FILE_NAME = "funsd.zip"
-
+def test_funsd(input_size, num_samples, rotate, recognition, prepared_funsd):
     ds = datasets.FUNSD(
         train=True,
         download=True,
-        img_transforms=Resize(input_size),
+        img_transforms=_resize(input_size),
         use_polygons=rotate,
         recognition_task=recognition,
-        cache_dir="/".join(mock_funsd_dataset.split("/")[:-2]),
-        cache_subdir=mock_funsd_dataset.split("/")[-2],
+        **prepared_funsd,
     )
 
     assert len(ds) == num_samples
@@ -402,7 +486,7 @@ def test_funsd(input_size, num_samples, rotate, recognition, mock_funsd_dataset)
         _validate_dataset(ds, input_size, is_polygons=rotate)
 
 
-@pytest.mark.parametrize("rotate", [True, False])
+@pytest.mark.parametrize("rotate", [True, False], ids=["rotated", "straight"])
 @pytest.mark.parametrize(
     "input_size, num_samples, recognition",
     [
@@ -410,18 +494,14 @@ def test_funsd(input_size, num_samples, rotate, recognition, mock_funsd_dataset)
         [[32, 128], 9, True],  # recognition
     ],
 )
-def test_cord(input_size, num_samples, rotate, recognition, mock_cord_dataset):
-    # monkeypatch the path to temporary dataset
-    datasets.CORD.TRAIN = (mock_cord_dataset, None, "cord_train.zip")
-
+def test_cord(input_size, num_samples, rotate, recognition, prepared_cord):
     ds = datasets.CORD(
         train=True,
         download=True,
-        img_transforms=Resize(input_size),
+        img_transforms=_resize(input_size),
         use_polygons=rotate,
         recognition_task=recognition,
-        cache_dir="/".join(mock_cord_dataset.split("/")[:-2]),
-        cache_subdir=mock_cord_dataset.split("/")[-2],
+        **prepared_cord,
     )
 
     assert len(ds) == num_samples
@@ -432,7 +512,7 @@ def test_cord(input_size, num_samples, rotate, recognition, mock_cord_dataset):
         _validate_dataset(ds, input_size, is_polygons=rotate)
 
 
-@pytest.mark.parametrize("rotate", [True, False])
+@pytest.mark.parametrize("rotate", [True, False], ids=["rotated", "straight"])
 @pytest.mark.parametrize(
     "input_size, num_samples, recognition",
     [
@@ -440,19 +520,14 @@ def test_cord(input_size, num_samples, rotate, recognition, mock_cord_dataset):
         [[32, 128], 10, True],  # recognition
     ],
 )
-def test_synthtext(input_size, num_samples, rotate, recognition, mock_synthtext_dataset):
-    # monkeypatch the path to temporary dataset
-    datasets.SynthText.URL = mock_synthtext_dataset
-    datasets.SynthText.SHA256 = None
-
+def test_synthtext(input_size, num_samples, rotate, recognition, prepared_synthtext):
     ds = datasets.SynthText(
         train=True,
         download=True,
-        img_transforms=Resize(input_size),
+        img_transforms=_resize(input_size),
         use_polygons=rotate,
         recognition_task=recognition,
-        cache_dir="/".join(mock_synthtext_dataset.split("/")[:-2]),
-        cache_subdir=mock_synthtext_dataset.split("/")[-2],
+        **prepared_synthtext,
     )
 
     assert len(ds) == num_samples
@@ -463,7 +538,7 @@ def test_synthtext(input_size, num_samples, rotate, recognition, mock_synthtext_
         _validate_dataset(ds, input_size, is_polygons=rotate)
 
 
-@pytest.mark.parametrize("rotate", [True, False])
+@pytest.mark.parametrize("rotate", [True, False], ids=["rotated", "straight"])
 @pytest.mark.parametrize(
     "input_size, num_samples, recognition",
     [
@@ -471,19 +546,14 @@ def test_synthtext(input_size, num_samples, rotate, recognition, mock_synthtext_
         [[32, 128], 1, True],  # recognition
     ],
 )
-def test_iiit5k(input_size, num_samples, rotate, recognition, mock_iiit5k_dataset):
-    # monkeypatch the path to temporary dataset
-    datasets.IIIT5K.URL = mock_iiit5k_dataset
-    datasets.IIIT5K.SHA256 = None
-
+def test_iiit5k(input_size, num_samples, rotate, recognition, prepared_iiit5k):
     ds = datasets.IIIT5K(
         train=True,
         download=True,
-        img_transforms=Resize(input_size),
+        img_transforms=_resize(input_size),
         use_polygons=rotate,
         recognition_task=recognition,
-        cache_dir="/".join(mock_iiit5k_dataset.split("/")[:-2]),
-        cache_subdir=mock_iiit5k_dataset.split("/")[-2],
+        **prepared_iiit5k,
     )
 
     assert len(ds) == num_samples
@@ -494,7 +564,7 @@ def test_iiit5k(input_size, num_samples, rotate, recognition, mock_iiit5k_datase
         _validate_dataset(ds, input_size, batch_size=1, is_polygons=rotate)
 
 
-@pytest.mark.parametrize("rotate", [True, False])
+@pytest.mark.parametrize("rotate", [True, False], ids=["rotated", "straight"])
 @pytest.mark.parametrize(
     "input_size, num_samples, recognition",
     [
@@ -502,19 +572,14 @@ def test_iiit5k(input_size, num_samples, rotate, recognition, mock_iiit5k_datase
         [[32, 128], 3, True],  # recognition
     ],
 )
-def test_svt(input_size, num_samples, rotate, recognition, mock_svt_dataset):
-    # monkeypatch the path to temporary dataset
-    datasets.SVT.URL = mock_svt_dataset
-    datasets.SVT.SHA256 = None
-
+def test_svt(input_size, num_samples, rotate, recognition, prepared_svt):
     ds = datasets.SVT(
         train=True,
         download=True,
-        img_transforms=Resize(input_size),
+        img_transforms=_resize(input_size),
         use_polygons=rotate,
         recognition_task=recognition,
-        cache_dir="/".join(mock_svt_dataset.split("/")[:-2]),
-        cache_subdir=mock_svt_dataset.split("/")[-2],
+        **prepared_svt,
     )
 
     assert len(ds) == num_samples
@@ -525,7 +590,7 @@ def test_svt(input_size, num_samples, rotate, recognition, mock_svt_dataset):
         _validate_dataset(ds, input_size, is_polygons=rotate)
 
 
-@pytest.mark.parametrize("rotate", [True, False])
+@pytest.mark.parametrize("rotate", [True, False], ids=["rotated", "straight"])
 @pytest.mark.parametrize(
     "input_size, num_samples, recognition",
     [
@@ -533,18 +598,14 @@ def test_svt(input_size, num_samples, rotate, recognition, mock_svt_dataset):
         [[32, 128], 3, True],  # recognition
     ],
 )
-def test_ic03(input_size, num_samples, rotate, recognition, mock_ic03_dataset):
-    # monkeypatch the path to temporary dataset
-    datasets.IC03.TRAIN = (mock_ic03_dataset, None, "ic03_train.zip")
-
+def test_ic03(input_size, num_samples, rotate, recognition, prepared_ic03):
     ds = datasets.IC03(
         train=True,
         download=True,
-        img_transforms=Resize(input_size),
+        img_transforms=_resize(input_size),
         use_polygons=rotate,
         recognition_task=recognition,
-        cache_dir="/".join(mock_ic03_dataset.split("/")[:-2]),
-        cache_subdir=mock_ic03_dataset.split("/")[-2],
+        **prepared_ic03,
     )
 
     assert len(ds) == num_samples
@@ -555,7 +616,7 @@ def test_ic03(input_size, num_samples, rotate, recognition, mock_ic03_dataset):
         _validate_dataset(ds, input_size, is_polygons=rotate)
 
 
-@pytest.mark.parametrize("rotate", [True, False])
+@pytest.mark.parametrize("rotate", [True, False], ids=["rotated", "straight"])
 @pytest.mark.parametrize(
     "input_size, num_samples, recognition",
     [
@@ -567,7 +628,7 @@ def test_wildreceipt_dataset(input_size, num_samples, rotate, recognition, mock_
     ds = datasets.WILDRECEIPT(
         *mock_wildreceipt_dataset,
         train=True,
-        img_transforms=Resize(input_size),
+        img_transforms=_resize(input_size),
         use_polygons=rotate,
         recognition_task=recognition,
     )
@@ -586,7 +647,7 @@ def test_mjsynth_dataset(mock_mjsynth_dataset):
     input_size = (32, 128)
     ds = datasets.MJSynth(
         *mock_mjsynth_dataset,
-        img_transforms=Resize(input_size, preserve_aspect_ratio=True),
+        img_transforms=_resize(input_size, preserve_aspect_ratio=True),
     )
 
     assert len(ds) == 4  # Actual set has 7581382 train and 1337891 test samples
@@ -598,7 +659,7 @@ def test_iiithws_dataset(mock_iiithws_dataset):
     input_size = (32, 128)
     ds = datasets.IIITHWS(
         *mock_iiithws_dataset,
-        img_transforms=Resize(input_size, preserve_aspect_ratio=True),
+        img_transforms=_resize(input_size, preserve_aspect_ratio=True),
     )
 
     assert len(ds) == 4  # Actual set has 7141797 train and 793533 test samples
@@ -48,6 +48,13 @@ def test_resize():
     out = transfo(input_t)
     assert out.dtype == tf.float16
 
+    # No antialiasing
+    transfo = T.Resize(output_size, antialias=False)
+    assert not transfo.antialias
+    input_t = tf.cast(tf.fill([64, 64, 3], 1), dtype=tf.float32)
+    out = transfo(input_t)
+    assert out.shape[:2] == output_size
+
 
 def test_compose():
     output_size = (16, 16)